@@ -43,10 +43,6 @@ func (h *PagesHandler) GetPage(c *fiber.Ctx) error {
 		return c.Status(fiber.StatusInternalServerError).JSON(apitypes.NewErrorResponse("No active session"))
 	}
 
-	// Get table metadata for primary key info
-	tableMeta := pages.GetTableMetadata()
-	primaryKeyField := tableMeta.GetPrimaryKeyField(pageDef.Page.SourceTable)
-
 	// Get field captions using i18n
 	var captions *apitypes.CaptionData
 	if pageDef.Page.SourceTable != "" {
@@ -56,25 +52,18 @@ func (h *PagesHandler) GetPage(c *fiber.Ctx) error {
 		// Build field captions map
 		fieldCaptions := make(map[string]string)
 
-		// Get captions for card page sections and mark primary key
+		// Get captions for card page sections
+		// (primary key flags are set once when the page definition is loaded)
 		for i := range pageDef.Page.Layout.Sections {
-			for j := range pageDef.Page.Layout.Sections[i].Fields {
-				field := &pageDef.Page.Layout.Sections[i].Fields[j]
+			for _, field := range pageDef.Page.Layout.Sections[i].Fields {
 				fieldCaptions[field.Source] = ts.FieldCaption(pageDef.Page.SourceTable, field.Source, lang)
-				if field.Source == primaryKeyField {
-					field.PrimaryKey = true
-				}
 			}
 		}
 
-		// Get captions for list page repeater and mark primary key
+		// Get captions for list page repeater
 		if pageDef.Page.Layout.Repeater != nil {
-			for i := range pageDef.Page.Layout.Repeater.Fields {
-				field := &pageDef.Page.Layout.Repeater.Fields[i]
+			for _, field := range pageDef.Page.Layout.Repeater.Fields {
 				fieldCaptions[field.Source] = ts.FieldCaption(pageDef.Page.SourceTable, field.Source, lang)
-				if field.Source == primaryKeyField {
-					field.PrimaryKey = true
-				}
 			}
 		}
 
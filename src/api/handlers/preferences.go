@@ -119,12 +119,16 @@ func (h *PreferencesHandler) SavePreference(c *fiber.Ctx) error {
 	now := types.NewDateTimeFromTime(time.Now())
 
 	if exists {
-		// Update existing preference
-		pref.Preference_data = types.NewText(string(dataJSON))
-		pref.Updated_at = now
-
-		if !pref.Modify(true) {
-			return c.Status(500).JSON(apitypes.NewErrorResponse("Failed to update preference"))
+		// Update existing preference - skip the write (and its commit) when the
+		// client re-saves identical data, so updated_at only moves on real changes
+		newData := types.NewText(string(dataJSON))
+		if !pref.Preference_data.Equal(newData) {
+			pref.Preference_data = newData
+			pref.Updated_at = now
+
+			if !pref.Modify(true) {
+				return c.Status(500).JSON(apitypes.NewErrorResponse("Failed to update preference"))
+			}
 		}
 	} else {
 		// Insert new preference
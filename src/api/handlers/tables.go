@@ -445,17 +445,17 @@ func (h *TablesHandler) ValidateField(c *fiber.Ctx) error {
 // Helper functions
 
 // filterFlowFields returns only the FlowFields that are in the requested fields list
+// The FlowField list is tiny, so it is intersected directly instead of building a
+// lookup map over every requested field
 func filterFlowFields(requestedFields []string, availableFlowFields []string) []string {
-	var result []string
-	requestedMap := make(map[string]bool)
-
-	for _, field := range requestedFields {
-		requestedMap[field] = true
-	}
+	result := make([]string, 0, len(availableFlowFields))
 
 	for _, flowField := range availableFlowFields {
-		if requestedMap[flowField] {
-			result = append(result, flowField)
+		for _, field := range requestedFields {
+			if field == flowField {
+				result = append(result, flowField)
+				break
+			}
 		}
 	}
 
@@ -476,19 +476,19 @@ func (h *TablesHandler) listCustomers(company, sortBy, sortOrder string, request
 		customer.SetCurrentKey(sortBy)
 	}
 
+	// Only calculate FlowFields that are requested; resolved once for the whole result set
+	// If no fields specified, calculate all FlowFields (backward compatibility)
+	flowFieldsToCalc := []string{"balance_lcy", "sales_lcy", "no_of_ledger_entries"}
+	if len(requestedFields) > 0 {
+		flowFieldsToCalc = filterFlowFields(requestedFields, flowFieldsToCalc)
+	}
+
 	var customers []map[string]interface{}
 
 	if customer.FindSet() {
 		for {
-			// Only calculate FlowFields that are requested
-			if len(requestedFields) > 0 {
-				flowFieldsToCalc := filterFlowFields(requestedFields, []string{"balance_lcy", "sales_lcy", "no_of_ledger_entries"})
-				if len(flowFieldsToCalc) > 0 {
-					customer.CalcFields(flowFieldsToCalc...)
-				}
-			} else {
-				// If no fields specified, calculate all FlowFields (backward compatibility)
-				customer.CalcFields("balance_lcy", "sales_lcy", "no_of_ledger_entries")
+			if len(flowFieldsToCalc) > 0 {
+				customer.CalcFields(flowFieldsToCalc...)
 			}
 
 			customers = append(customers, customerToMap(&customer))
@@ -614,36 +614,26 @@ func (h *TablesHandler) getCustomerLedgerEntryIDs(company, sortBy string) ([]str
 }
 
 func (h *TablesHandler) addFieldCaptions(tableName, language string, captions *apitypes.CaptionData) {
-	ts := i18n.GetInstance()
+	var fields []string
 
 	switch tableName {
 	case "Customer":
-		fields := []string{"no", "name", "address", "post_code", "city", "phonenumber", "email",
+		fields = []string{"no", "name", "address", "post_code", "city", "phonenumber", "email",
 			"payment_terms_code", "credit_limit", "balance_lcy", "sales_lcy", "no_of_ledger_entries",
 			"last_order_date", "created_at", "status"}
-		for _, field := range fields {
-			captions.Fields[field] = ts.FieldCaption(tableName, field, language)
-		}
 
 	case "Payment_terms":
-		fields := []string{"code", "description", "due_date_calculation", "discount_date_calculation", "discount_percent"}
-		for _, field := range fields {
-			captions.Fields[field] = ts.FieldCaption(tableName, field, language)
-		}
+		fields = []string{"code", "description", "due_date_calculation", "discount_date_calculation", "discount_percent"}
 
 	case "Customer_ledger_entry":
-		fields := []string{"entry_no", "customer_no", "posting_date", "document_type", "document_no",
+		fields = []string{"entry_no", "customer_no", "posting_date", "document_type", "document_no",
 			"description", "amount", "remaining_amount"}
-		for _, field := range fields {
-			captions.Fields[field] = ts.FieldCaption(tableName, field, language)
-		}
 
 	case "User":
-		fields := []string{"user_id", "user_name", "email", "language", "active", "created_at", "last_login"}
-		for _, field := range fields {
-			captions.Fields[field] = ts.FieldCaption(tableName, field, language)
-		}
+		fields = []string{"user_id", "user_name", "email", "language", "active", "created_at", "last_login"}
 	}
+
+	i18n.GetInstance().FieldCaptions(tableName, fields, language, captions.Fields)
 }
 
 // Conversion functions: Table struct <-> map[string]interface{}
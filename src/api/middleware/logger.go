@@ -2,6 +2,7 @@ package middleware
 
 import (
 	"fmt"
+	"os"
 	"time"
 
 	"github.com/gofiber/fiber/v2"
@@ -9,6 +10,9 @@ import (
 
 // Logger returns a simple logging middleware
 func Logger() fiber.Handler {
+	// Only colorize when stdout is a terminal, so piped/file logs stay plain
+	colorize := isTerminal(os.Stdout)
+
 	return func(c *fiber.Ctx) error {
 		start := time.Now()
 
@@ -19,17 +23,22 @@ func Logger() fiber.Handler {
 		duration := time.Since(start)
 		status := c.Response().StatusCode()
 
-		// Color code based on status
-		statusColor := "\033[32m" // Green for 2xx
-		if status >= 400 && status < 500 {
-			statusColor = "\033[33m" // Yellow for 4xx
-		} else if status >= 500 {
-			statusColor = "\033[31m" // Red for 5xx
+		// Color code based on status (empty codes when not colorizing)
+		statusColor, colorReset := "", ""
+		if colorize {
+			colorReset = "\033[0m"
+			statusColor = "\033[32m" // Green for 2xx
+			if status >= 400 && status < 500 {
+				statusColor = "\033[33m" // Yellow for 4xx
+			} else if status >= 500 {
+				statusColor = "\033[31m" // Red for 5xx
+			}
 		}
 
-		fmt.Printf("%s[%d]\033[0m %s %-7s %s (%v)\n",
+		fmt.Printf("%s[%d]%s %s %-7s %s (%v)\n",
 			statusColor,
 			status,
+			colorReset,
 			c.Method(),
 			c.Path(),
 			c.IP(),
@@ -39,3 +48,12 @@ func Logger() fiber.Handler {
 		return err
 	}
 }
+
+// isTerminal reports whether f is a character device (an interactive terminal)
+func isTerminal(f *os.File) bool {
+	info, err := f.Stat()
+	if err != nil {
+		return false
+	}
+	return info.Mode()&os.ModeCharDevice != 0
+}
@@ -72,26 +72,32 @@ func (c *BidirectionalNavDemo) ensureTestData() int {
 		return existingCount // Already have enough test data
 	}
 
-	// Create 20 test customers
+	// Create 20 test customers in one transaction (a single commit instead of one per row)
 	cities := []string{"New York", "Chicago", "Los Angeles", "Houston", "Phoenix"}
-	for i := 1; i <= 20; i++ {
-		customer.Init(c.session.GetConnection(), c.session.GetCompany())
-		customerNo := fmt.Sprintf("C%04d", i)
-
-		// Check if exists
-		if customer.Get(types.NewCode(customerNo)) {
-			continue // Skip if already exists
+	err := c.session.WithTransaction(func() error {
+		for i := 1; i <= 20; i++ {
+			customer.Init(c.session.GetExecutor(), c.session.GetCompany())
+			customerNo := fmt.Sprintf("C%04d", i)
+
+			// Check if exists
+			if customer.Get(types.NewCode(customerNo)) {
+				continue // Skip if already exists
+			}
+
+			// Create new customer
+			customer.No = types.NewCode(customerNo)
+			customer.Name = types.NewText(fmt.Sprintf("Test Customer %d", i))
+			customer.Address = types.NewText(fmt.Sprintf("%d Main Street", i*100))
+			customer.City = types.NewText(cities[(i-1)%len(cities)])
+			customer.Post_code = types.NewCode(fmt.Sprintf("%05d", 10000+i))
+			customer.Phonenumber = types.NewText(fmt.Sprintf("555-%04d", i))
+
+			customer.Insert(false) // Don't run triggers for test data
 		}
-
-		// Create new customer
-		customer.No = types.NewCode(customerNo)
-		customer.Name = types.NewText(fmt.Sprintf("Test Customer %d", i))
-		customer.Address = types.NewText(fmt.Sprintf("%d Main Street", i*100))
-		customer.City = types.NewText(cities[(i-1)%len(cities)])
-		customer.Post_code = types.NewCode(fmt.Sprintf("%05d", 10000+i))
-		customer.Phonenumber = types.NewText(fmt.Sprintf("555-%04d", i))
-
-		customer.Insert(false) // Don't run triggers for test data
+		return nil
+	})
+	if err != nil {
+		fmt.Printf("✗ Failed to create test data: %v\n", err)
 	}
 
 	customer.Init(c.session.GetConnection(), c.session.GetCompany())
@@ -4,9 +4,11 @@ import (
 	"database/sql"
 	"fmt"
 	"math/rand"
+	"strings"
 	"time"
 
 	"github.com/hansjlachmann/openerp/src/business-logic/tables"
+	"github.com/hansjlachmann/openerp/src/foundation/database"
 	"github.com/hansjlachmann/openerp/src/foundation/types"
 )
 
@@ -65,11 +67,9 @@ func CreateLargeCustomerDataset(db *sql.DB, company string) {
 	batchSize := 1000
 	commitBatchSize := 1000 // Commit transaction every N inserts
 
-	// Enable WAL mode for better concurrent write performance
-	db.Exec("PRAGMA journal_mode=WAL")
-
-	// Start transaction for batch inserts
-	_, err = db.Exec("BEGIN TRANSACTION")
+	// Start transaction for batch inserts. BEGIN/COMMIT must run on the same
+	// connection, so use a *sql.Tx rather than raw statements on the pool.
+	tx, err := db.Begin()
 	if err != nil {
 		fmt.Printf("✗ Failed to start transaction: %v\n", err)
 		return
@@ -78,7 +78,7 @@ func CreateLargeCustomerDataset(db *sql.DB, company string) {
 	for i := 0; i < numEntries; i++ {
 		entryNo := startEntryNo + i
 		entry := tables.NewCustomerLedgerEntry()
-		entry.Init(db, company)
+		entry.Init(tx, company)
 
 		entry.Entry_no = entryNo
 		entry.Customer_no = types.NewCode("CUST-001")
@@ -155,18 +155,18 @@ func CreateLargeCustomerDataset(db *sql.DB, company string) {
 
 		if !entry.Insert(false) {
 			fmt.Printf("\n✗ Failed to insert entry %d\n", entryNo)
-			db.Exec("ROLLBACK")
+			tx.Rollback()
 			return
 		}
 
 		// Commit transaction and start a new one every commitBatchSize inserts
 		if (i+1)%commitBatchSize == 0 {
-			if _, err := db.Exec("COMMIT"); err != nil {
+			if err := tx.Commit(); err != nil {
 				fmt.Printf("\n✗ Failed to commit transaction: %v\n", err)
 				return
 			}
 			// Start new transaction
-			if _, err := db.Exec("BEGIN TRANSACTION"); err != nil {
+			if tx, err = db.Begin(); err != nil {
 				fmt.Printf("\n✗ Failed to start new transaction: %v\n", err)
 				return
 			}
@@ -184,7 +184,7 @@ func CreateLargeCustomerDataset(db *sql.DB, company string) {
 	}
 
 	// Final commit for remaining records
-	if _, err := db.Exec("COMMIT"); err != nil {
+	if err := tx.Commit(); err != nil {
 		fmt.Printf("\n✗ Failed to commit final transaction: %v\n", err)
 		return
 	}
@@ -219,7 +219,7 @@ func CalcFieldsLargeCustomer(db *sql.DB, company string) {
 	// Calculate FlowFields with timing
 	fmt.Println("Calculating FlowFields (Balance, Sales, Entry Count)...")
 	fmt.Println("Dataset: 100,000+ entries")
-	fmt.Println("Indexes: customer_open (customer_no, open)")
+	fmt.Println("Indexes:", describeKeys(db, company+"$"+tables.CustomerLedgerEntryTableName, "customer_open", "customer"))
 	fmt.Println()
 
 	calcStart := time.Now()
@@ -313,3 +313,18 @@ func CalcFieldsLargeCustomer(db *sql.DB, company string) {
 	fmt.Println("FlowField Calculation Complete!")
 	fmt.Println("========================================")
 }
+
+// describeKeys lists the given keys of a table with the columns their indexes
+// actually have in this database
+func describeKeys(db *sql.DB, tableName string, keyNames ...string) string {
+	parts := make([]string, 0, len(keyNames))
+	for _, keyName := range keyNames {
+		columns, err := database.GetIndexColumns(db, tableName+"$"+keyName)
+		if err != nil || len(columns) == 0 {
+			parts = append(parts, keyName+" (missing)")
+			continue
+		}
+		parts = append(parts, fmt.Sprintf("%s (%s)", keyName, strings.Join(columns, ", ")))
+	}
+	return strings.Join(parts, ", ")
+}
@@ -138,12 +138,12 @@ func (t *CustomerLedgerEntry) CustomValidate_Customer_no() error {
 	if t.Customer_no != "" && t.Customer_no != types.Code("") {
 		var relatedRecord Customer
 		relatedRecord.Init(t.db, t.company)
-		if !relatedRecord.Get(t.Customer_no) {
+		if !relatedRecord.Exists(t.Customer_no) {
 			return errors.New("customer_no does not exist in Customer table")
 		}
 
 		// *** ADD YOUR CUSTOM LOGIC HERE ***
-		// You can access the related record:
+		// Exists only checks the key; use Get to access the related record:
 		// if !relatedRecord.Active {
 		//     return errors.New("Customer is inactive")
 		// }
@@ -158,12 +158,12 @@ func (t *CustomerLedgerEntry) CustomValidate_Sell_to_customer_no() error {
 	if t.Sell_to_customer_no != "" && t.Sell_to_customer_no != types.Code("") {
 		var relatedRecord Customer
 		relatedRecord.Init(t.db, t.company)
-		if !relatedRecord.Get(t.Sell_to_customer_no) {
+		if !relatedRecord.Exists(t.Sell_to_customer_no) {
 			return errors.New("sell_to_customer_no does not exist in Customer table")
 		}
 
 		// *** ADD YOUR CUSTOM LOGIC HERE ***
-		// You can access the related record:
+		// Exists only checks the key; use Get to access the related record:
 		// if !relatedRecord.Active {
 		//     return errors.New("Customer is inactive")
 		// }
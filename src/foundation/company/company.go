@@ -13,13 +13,16 @@ type Manager struct {
 	db       *database.Database
 	registry interface {
 		InitializeCompanyTables(db *sql.DB, companyName string) error
+		CreateCompanyTablesTx(tx database.Executor, companyName string) (int, error)
 		GetTableCount() int
 	}
+	tablesSynced bool // Set after the first full table sync; registered schemas don't change afterwards
 }
 
 // NewManager creates a new company manager
 func NewManager(db *database.Database, registry interface {
 	InitializeCompanyTables(db *sql.DB, companyName string) error
+	CreateCompanyTablesTx(tx database.Executor, companyName string) (int, error)
 	GetTableCount() int
 }) *Manager {
 	return &Manager{
@@ -39,28 +42,44 @@ func (m *Manager) CreateCompany(name string) error {
 		return err
 	}
 
+	// Create the company record and its tables in one transaction:
+	// a failed table initialization rolls back the company record too
+	tx, err := m.db.GetConnection().Begin()
+	if err != nil {
+		return fmt.Errorf("failed to begin transaction: %w", err)
+	}
+	defer tx.Rollback()
+
 	// Create company record
-	_, err := m.db.GetConnection().Exec(`INSERT INTO "Company" (name) VALUES ($1)`, name)
+	_, err = tx.Exec(`INSERT INTO "Company" (name) VALUES ($1)`, name)
 	if err != nil {
-		if strings.Contains(err.Error(), "duplicate key") {
+		if strings.Contains(err.Error(), "UNIQUE constraint failed") || strings.Contains(err.Error(), "duplicate key") {
 			return fmt.Errorf("company '%s' already exists", name)
 		}
 		return fmt.Errorf("failed to create company: %w", err)
 	}
 
 	// Initialize all registered tables for this company
+	created := 0
 	if m.registry != nil {
 		tableCount := m.registry.GetTableCount()
 		if tableCount > 0 {
-			err = m.registry.InitializeCompanyTables(m.db.GetConnection(), name)
+			created, err = m.registry.CreateCompanyTablesTx(tx, name)
 			if err != nil {
-				// Rollback: delete the company if table initialization fails
-				m.db.GetConnection().Exec(`DELETE FROM "Company" WHERE name = $1`, name)
 				return fmt.Errorf("failed to initialize tables for company '%s': %w", name, err)
 			}
 		}
 	}
 
+	if err := tx.Commit(); err != nil {
+		return fmt.Errorf("failed to commit company creation: %w", err)
+	}
+
+	// Report only once the company and its tables are committed
+	if created > 0 {
+		fmt.Printf("✓ Created %d new table(s)\n", created)
+	}
+
 	return nil
 }
 
@@ -91,7 +110,8 @@ func (m *Manager) EnterCompany(name string) error {
 
 	// Auto-sync: Create any missing tables for ALL companies
 	// This ensures new tables are automatically created across all companies (BC/NAV style)
-	if m.registry != nil {
+	// Runs once per manager: later companies are fully initialized by CreateCompany
+	if m.registry != nil && !m.tablesSynced {
 		tableCount := m.registry.GetTableCount()
 		if tableCount > 0 {
 			// Get all companies
@@ -109,6 +129,7 @@ func (m *Manager) EnterCompany(name string) error {
 				}
 			}
 			fmt.Println()
+			m.tablesSynced = true
 		}
 	}
 
@@ -141,60 +162,62 @@ func (m *Manager) DeleteCompany(name string) error {
 		return fmt.Errorf("company name cannot be empty")
 	}
 
-	// Verify company exists
-	var companyName string
-	err := m.db.GetConnection().QueryRow(`SELECT name FROM "Company" WHERE name = $1`, name).Scan(&companyName)
-	if err == sql.ErrNoRows {
-		return fmt.Errorf("company '%s' does not exist", name)
-	}
+	// Drop the tables and the company record in one transaction: one commit
+	// instead of one per statement, and a failure leaves the company intact
+	tx, err := m.db.GetConnection().Begin()
 	if err != nil {
-		return fmt.Errorf("failed to verify company: %w", err)
+		return fmt.Errorf("failed to begin transaction: %w", err)
 	}
+	defer tx.Rollback()
 
-	// If this is the current company, exit it first
-	if m.db.GetCurrentCompany() == name {
-		m.db.SetCurrentCompany("")
+	// Delete company record (also verifies the company exists)
+	result, err := tx.Exec(`DELETE FROM "Company" WHERE name = $1`, name)
+	if err != nil {
+		return fmt.Errorf("failed to delete company: %w", err)
+	}
+	if rowsAffected, _ := result.RowsAffected(); rowsAffected == 0 {
+		return fmt.Errorf("company '%s' does not exist", name)
 	}
 
 	// Find all tables belonging to this company (Company$TableName pattern)
-	rows, err := m.db.GetConnection().Query(`
-		SELECT table_name
-		FROM information_schema.tables
-		WHERE table_schema = 'public'
-		AND table_name LIKE $1
-	`, name+"$%")
+	// substr avoids LIKE treating _ in company names as a wildcard
+	rows, err := tx.Query(`
+		SELECT name FROM sqlite_master
+		WHERE type='table' AND substr(name, 1, length(?1)) = ?1
+	`, name+"$")
 	if err != nil {
 		return fmt.Errorf("failed to find company tables: %w", err)
 	}
-	defer rows.Close()
 
 	var tables []string
 	for rows.Next() {
 		var tableName string
 		if err := rows.Scan(&tableName); err != nil {
+			rows.Close()
 			return fmt.Errorf("failed to read table name: %w", err)
 		}
 		tables = append(tables, tableName)
 	}
+	rows.Close()
+	if err := rows.Err(); err != nil {
+		return fmt.Errorf("failed to find company tables: %w", err)
+	}
 
-	// Delete all company tables
+	// Delete all company tables (their indexes are dropped with them)
 	for _, tableName := range tables {
-		_, err := m.db.GetConnection().Exec(fmt.Sprintf(`DROP TABLE IF EXISTS "%s"`, tableName))
+		_, err := tx.Exec(fmt.Sprintf(`DROP TABLE IF EXISTS %s`, database.QuoteIdentifier(tableName)))
 		if err != nil {
 			return fmt.Errorf("failed to drop table %s: %w", tableName, err)
 		}
 	}
 
-	// Delete field definitions for this company
-	_, err = m.db.GetConnection().Exec(`DELETE FROM "FieldDefinition" WHERE company = $1`, name)
-	if err != nil {
-		return fmt.Errorf("failed to delete field definitions: %w", err)
+	if err := tx.Commit(); err != nil {
+		return fmt.Errorf("failed to commit company deletion: %w", err)
 	}
 
-	// Delete company record
-	_, err = m.db.GetConnection().Exec(`DELETE FROM "Company" WHERE name = $1`, name)
-	if err != nil {
-		return fmt.Errorf("failed to delete company: %w", err)
+	// If this was the current company, exit it
+	if m.db.GetCurrentCompany() == name {
+		m.db.SetCurrentCompany("")
 	}
 
 	return nil
@@ -221,6 +244,10 @@ func (m *Manager) ListCompanies() ([]string, error) {
 		companies = append(companies, name)
 	}
 
+	if err := rows.Err(); err != nil {
+		return nil, fmt.Errorf("failed to list companies: %w", err)
+	}
+
 	return companies, nil
 }
 
@@ -57,8 +57,11 @@ func SaveLastConnection(dbPath, company string) error {
 	return os.WriteFile(configPath, data, 0644)
 }
 
-// ClearLastConnection removes the config file
+// ClearLastConnection removes the config file (a missing file is not an error)
 func ClearLastConnection() error {
 	configPath := getConfigPath()
-	return os.Remove(configPath)
+	if err := os.Remove(configPath); err != nil && !os.IsNotExist(err) {
+		return err
+	}
+	return nil
 }
@@ -0,0 +1,46 @@
+package config
+
+import (
+	"fmt"
+	"os"
+	"path/filepath"
+	"sync"
+)
+
+var (
+	projectRoot     string
+	projectRootErr  error
+	projectRootOnce sync.Once
+)
+
+// FindProjectRoot returns the project root directory (the nearest parent of the
+// working directory containing go.mod). The walk runs once per process
+func FindProjectRoot() (string, error) {
+	projectRootOnce.Do(func() {
+		projectRoot, projectRootErr = findProjectRoot()
+	})
+	return projectRoot, projectRootErr
+}
+
+// findProjectRoot walks up from the working directory until it finds go.mod
+func findProjectRoot() (string, error) {
+	// Start from current working directory
+	dir, err := os.Getwd()
+	if err != nil {
+		return "", err
+	}
+
+	// Walk up until we find go.mod
+	for {
+		if _, err := os.Stat(filepath.Join(dir, "go.mod")); err == nil {
+			return dir, nil
+		}
+
+		parent := filepath.Dir(dir)
+		if parent == dir {
+			// Reached root without finding go.mod
+			return "", fmt.Errorf("project root not found (no go.mod)")
+		}
+		dir = parent
+	}
+}
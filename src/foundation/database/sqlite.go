@@ -8,6 +8,35 @@ import (
 	_ "github.com/mattn/go-sqlite3"
 )
 
+// connectionParams are applied by the driver to every pooled connection:
+// foreign keys, WAL journaling (readers don't block the writer), NORMAL sync
+// (safe with WAL, one fsync per checkpoint instead of per commit) and a busy timeout
+const connectionParams = "_foreign_keys=on&_journal_mode=WAL&_synchronous=NORMAL&_busy_timeout=5000"
+
+// maxOpenConns bounds the connection pool shared by API handlers and sessions.
+// WAL lets these readers run alongside the single writer; keeping the same number
+// idle avoids reconnecting (and re-applying connectionParams) under load
+const maxOpenConns = 8
+
+// companyTableSQL creates the global Company table
+const companyTableSQL = `
+	CREATE TABLE IF NOT EXISTS "Company" (
+		name TEXT PRIMARY KEY,
+		created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+	)
+`
+
+// UserTableSQL creates the global User table (no company prefix)
+const UserTableSQL = `
+	CREATE TABLE IF NOT EXISTS "User" (
+		username TEXT PRIMARY KEY,
+		password_hash TEXT NOT NULL,
+		full_name TEXT,
+		language TEXT DEFAULT 'en-US',
+		active INTEGER DEFAULT 1
+	)
+`
+
 // Database represents a SQLite database connection with session state
 type Database struct {
 	conn           *sql.DB
@@ -15,41 +44,42 @@ type Database struct {
 	currentCompany string // Per-connection state for thread safety
 }
 
-// CreateDatabase creates a new SQLite database file
-func CreateDatabase(path string) (*Database, error) {
-	conn, err := sql.Open("sqlite3", path)
+// openConnection opens the connection pool for path with the shared settings
+// used by both CreateDatabase and OpenDatabase
+func openConnection(path string) (*sql.DB, error) {
+	conn, err := sql.Open("sqlite3", path+"?"+connectionParams)
 	if err != nil {
-		return nil, fmt.Errorf("failed to create database: %w", err)
+		return nil, err
 	}
 
-	// Enable foreign keys
-	if _, err := conn.Exec("PRAGMA foreign_keys = ON"); err != nil {
+	// Verify the connection settings were accepted
+	if err := conn.Ping(); err != nil {
 		conn.Close()
-		return nil, fmt.Errorf("failed to enable foreign keys: %w", err)
+		return nil, err
+	}
+
+	conn.SetMaxOpenConns(maxOpenConns)
+	conn.SetMaxIdleConns(maxOpenConns)
+
+	return conn, nil
+}
+
+// CreateDatabase creates a new SQLite database file
+func CreateDatabase(path string) (*Database, error) {
+	conn, err := openConnection(path)
+	if err != nil {
+		return nil, fmt.Errorf("failed to create database: %w", err)
 	}
 
 	// Create Company table
-	_, err = conn.Exec(`
-		CREATE TABLE IF NOT EXISTS "Company" (
-			name TEXT PRIMARY KEY,
-			created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-		)
-	`)
+	_, err = conn.Exec(companyTableSQL)
 	if err != nil {
 		conn.Close()
 		return nil, fmt.Errorf("failed to create Company table: %w", err)
 	}
 
 	// Create User table (global, no company prefix)
-	_, err = conn.Exec(`
-		CREATE TABLE IF NOT EXISTS "User" (
-			username TEXT PRIMARY KEY,
-			password_hash TEXT NOT NULL,
-			full_name TEXT,
-			language TEXT DEFAULT 'en-US',
-			active INTEGER DEFAULT 1
-		)
-	`)
+	_, err = conn.Exec(UserTableSQL)
 	if err != nil {
 		conn.Close()
 		return nil, fmt.Errorf("failed to create User table: %w", err)
@@ -66,42 +96,31 @@ func CreateDatabase(path string) (*Database, error) {
 
 // OpenDatabase opens an existing SQLite database file
 func OpenDatabase(path string) (*Database, error) {
-	conn, err := sql.Open("sqlite3", path)
+	conn, err := openConnection(path)
 	if err != nil {
 		return nil, fmt.Errorf("failed to open database: %w", err)
 	}
 
-	// Enable foreign keys
-	if _, err := conn.Exec("PRAGMA foreign_keys = ON"); err != nil {
+	// Look up both global tables in one schema query
+	globalTables, err := getGlobalTables(conn)
+	if err != nil {
 		conn.Close()
-		return nil, fmt.Errorf("failed to enable foreign keys: %w", err)
+		return nil, fmt.Errorf("failed to verify database: %w", err)
 	}
 
 	// Verify Company table exists
-	var tableName string
-	err = conn.QueryRow("SELECT name FROM sqlite_master WHERE type='table' AND name='Company'").Scan(&tableName)
-	if err == sql.ErrNoRows {
+	if !globalTables["Company"] {
 		conn.Close()
 		return nil, fmt.Errorf("not a valid OpenERP database: Company table not found")
 	}
-	if err != nil {
-		conn.Close()
-		return nil, fmt.Errorf("failed to verify database: %w", err)
-	}
 
 	// Create User table if it doesn't exist (for database upgrade compatibility)
-	_, err = conn.Exec(`
-		CREATE TABLE IF NOT EXISTS "User" (
-			username TEXT PRIMARY KEY,
-			password_hash TEXT NOT NULL,
-			full_name TEXT,
-			language TEXT DEFAULT 'en-US',
-			active INTEGER DEFAULT 1
-		)
-	`)
-	if err != nil {
-		conn.Close()
-		return nil, fmt.Errorf("failed to create User table: %w", err)
+	if !globalTables["User"] {
+		_, err = conn.Exec(UserTableSQL)
+		if err != nil {
+			conn.Close()
+			return nil, fmt.Errorf("failed to create User table: %w", err)
+		}
 	}
 
 	db := &Database{
@@ -113,6 +132,26 @@ func OpenDatabase(path string) (*Database, error) {
 	return db, nil
 }
 
+// getGlobalTables returns which of the global (non-company) tables exist
+func getGlobalTables(conn *sql.DB) (map[string]bool, error) {
+	rows, err := conn.Query(`SELECT name FROM sqlite_master WHERE type='table' AND name IN ('Company', 'User')`)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+
+	tables := make(map[string]bool, 2)
+	for rows.Next() {
+		var name string
+		if err := rows.Scan(&name); err != nil {
+			return nil, err
+		}
+		tables[name] = true
+	}
+
+	return tables, rows.Err()
+}
+
 // CloseDatabase closes the database connection
 func (db *Database) CloseDatabase() error {
 	if db.conn == nil {
@@ -184,6 +223,27 @@ func (db *Database) TableExists(tableName string) (bool, error) {
 	return true, nil
 }
 
+// GetIndexColumns returns the columns of an index in key order
+// An index that doesn't exist returns no columns
+func GetIndexColumns(db Executor, indexName string) ([]string, error) {
+	rows, err := db.Query(`SELECT name FROM pragma_index_info(?) ORDER BY seqno`, indexName)
+	if err != nil {
+		return nil, fmt.Errorf("failed to get index info: %w", err)
+	}
+	defer rows.Close()
+
+	var columns []string
+	for rows.Next() {
+		var name string
+		if err := rows.Scan(&name); err != nil {
+			return nil, fmt.Errorf("failed to scan index info: %w", err)
+		}
+		columns = append(columns, name)
+	}
+
+	return columns, rows.Err()
+}
+
 // CreateTable creates a new table with the given schema
 func (db *Database) CreateTable(tableName, schema string) error {
 	if db.conn == nil {
@@ -194,6 +254,10 @@ func (db *Database) CreateTable(tableName, schema string) error {
 		return fmt.Errorf("no company context set - use EnterCompany() first")
 	}
 
+	if err := ValidateTableName(tableName); err != nil {
+		return err
+	}
+
 	fullTableName, err := db.GetFullTableName(tableName)
 	if err != nil {
 		return err
@@ -210,7 +274,7 @@ func (db *Database) CreateTable(tableName, schema string) error {
 	}
 
 	// Create table
-	createSQL := fmt.Sprintf(`CREATE TABLE "%s" (%s)`, fullTableName, schema)
+	createSQL := fmt.Sprintf(`CREATE TABLE %s (%s)`, QuoteIdentifier(fullTableName), schema)
 	_, err = db.conn.Exec(createSQL)
 	if err != nil {
 		return fmt.Errorf("failed to create table: %w", err)
@@ -229,15 +293,38 @@ func (db *Database) DropTable(tableName string) error {
 		return fmt.Errorf("no company context set - use EnterCompany() first")
 	}
 
+	if err := ValidateTableName(tableName); err != nil {
+		return err
+	}
+
 	fullTableName, err := db.GetFullTableName(tableName)
 	if err != nil {
 		return err
 	}
 
-	_, err = db.conn.Exec(fmt.Sprintf(`DROP TABLE IF EXISTS "%s"`, fullTableName))
+	_, err = db.conn.Exec(`DROP TABLE IF EXISTS ` + QuoteIdentifier(fullTableName))
 	return err
 }
 
+// ValidateTableName checks if a table name can be used as an SQL identifier
+func ValidateTableName(name string) error {
+	if strings.TrimSpace(name) == "" {
+		return fmt.Errorf("table name cannot be empty")
+	}
+
+	if strings.ContainsAny(name, "\x00\"") {
+		return fmt.Errorf("table name contains invalid characters (quotes and NUL not allowed)")
+	}
+
+	return nil
+}
+
+// QuoteIdentifier returns name as a double-quoted SQL identifier
+// Table names cannot be bound as query parameters, so embedded quotes are escaped
+func QuoteIdentifier(name string) string {
+	return `"` + strings.ReplaceAll(name, `"`, `""`) + `"`
+}
+
 // ValidateCompanyName checks if a company name is valid
 func ValidateCompanyName(name string) error {
 	if name == "" {
@@ -152,9 +152,10 @@ func IsNumeric(s string) bool {
 	return err == nil
 }
 
+// invalidFieldChars matches anything but alphanumeric, underscore, and dot (for table.field)
+var invalidFieldChars = regexp.MustCompile(`[^a-zA-Z0-9_.]`)
+
 // SanitizeFieldName ensures the field name is safe for SQL (prevents injection)
 func SanitizeFieldName(field string) string {
-	// Only allow alphanumeric, underscore, and dot (for table.field)
-	re := regexp.MustCompile(`[^a-zA-Z0-9_.]`)
-	return re.ReplaceAllString(field, "")
+	return invalidFieldChars.ReplaceAllString(field, "")
 }
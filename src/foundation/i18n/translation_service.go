@@ -8,6 +8,8 @@ import (
 	"sync"
 
 	"gopkg.in/yaml.v3"
+
+	"github.com/hansjlachmann/openerp/src/foundation/config"
 )
 
 // TranslationService manages multilanguage support
@@ -15,8 +17,13 @@ type TranslationService struct {
 	translations map[string]map[string]string // [language][key]value
 	defaultLang  string
 	mu           sync.RWMutex
+
+	tablePrefixes sync.Map // [tableName]"tables.<normalized>." - caption key prefix cache
 }
 
+// stringPool interns translation keys and values during a single load
+type stringPool map[string]string
+
 var (
 	instance *TranslationService
 	once     sync.Once
@@ -43,7 +50,7 @@ func (s *TranslationService) LoadTranslations() error {
 	defer s.mu.Unlock()
 
 	// Get project root (assuming we're in src/foundation/i18n)
-	rootPath, err := findProjectRoot()
+	rootPath, err := config.FindProjectRoot()
 	if err != nil {
 		return fmt.Errorf("failed to find project root: %w", err)
 	}
@@ -61,6 +68,9 @@ func (s *TranslationService) LoadTranslations() error {
 		return fmt.Errorf("failed to read translations directory: %w", err)
 	}
 
+	// Share one copy of each key and repeated value across all language maps
+	pool := make(stringPool)
+
 	loadedCount := 0
 	for _, entry := range entries {
 		if !entry.IsDir() {
@@ -88,7 +98,7 @@ func (s *TranslationService) LoadTranslations() error {
 			}
 
 			filePath := filepath.Join(langPath, file.Name())
-			if err := s.loadFile(lang, filePath); err != nil {
+			if err := s.loadFile(lang, filePath, pool); err != nil {
 				fmt.Printf("Warning: Failed to load %s: %v\n", filePath, err)
 			} else {
 				loadedCount++
@@ -100,47 +110,91 @@ func (s *TranslationService) LoadTranslations() error {
 		return fmt.Errorf("no translation files loaded")
 	}
 
+	s.mergeDefaultLanguage()
+
 	return nil
 }
 
+// mergeDefaultLanguage copies default language entries into every other language
+// map where the key is missing, so lookups resolve fallback text in one step
+func (s *TranslationService) mergeDefaultLanguage() {
+	defaults := s.translations[s.defaultLang]
+	for lang, langMap := range s.translations {
+		if lang == s.defaultLang {
+			continue
+		}
+		for key, value := range defaults {
+			if _, ok := langMap[key]; !ok {
+				langMap[key] = value
+			}
+		}
+	}
+}
+
 // loadFile loads a single translation YAML file
-func (s *TranslationService) loadFile(lang, filePath string) error {
+func (s *TranslationService) loadFile(lang, filePath string, pool stringPool) error {
 	data, err := os.ReadFile(filePath)
 	if err != nil {
 		return fmt.Errorf("failed to read file: %w", err)
 	}
 
-	var content map[string]interface{}
-	if err := yaml.Unmarshal(data, &content); err != nil {
+	// Decode into the node tree: translation files are nested mappings of
+	// scalars, so walking the nodes avoids building interface{} maps
+	var root yaml.Node
+	if err := yaml.Unmarshal(data, &root); err != nil {
 		return fmt.Errorf("failed to parse YAML: %w", err)
 	}
 
 	// Flatten nested structure into key-value pairs
-	s.flattenMap("", content, lang)
+	if len(root.Content) > 0 {
+		return s.flattenNode("", root.Content[0], lang, pool)
+	}
 
 	return nil
 }
 
-// flattenMap recursively flattens nested YAML into dot-notation keys
-func (s *TranslationService) flattenMap(prefix string, m map[string]interface{}, lang string) {
-	for key, value := range m {
+// flattenNode recursively flattens nested YAML mappings into dot-notation keys
+func (s *TranslationService) flattenNode(prefix string, node *yaml.Node, lang string, pool stringPool) error {
+	if node.Kind != yaml.MappingNode {
+		return fmt.Errorf("expected mapping at line %d", node.Line)
+	}
+
+	for i := 0; i+1 < len(node.Content); i += 2 {
+		key, value := node.Content[i].Value, node.Content[i+1]
 		fullKey := key
 		if prefix != "" {
-			fullKey = prefix + "." + key
+			fullKey = pool.intern(prefix + "." + key)
 		}
 
-		switch v := value.(type) {
-		case map[string]interface{}:
+		switch value.Kind {
+		case yaml.MappingNode:
 			// Recurse into nested maps
-			s.flattenMap(fullKey, v, lang)
-		case string:
-			// Store string value
-			s.translations[lang][fullKey] = v
+			if err := s.flattenNode(fullKey, value, lang, pool); err != nil {
+				return err
+			}
+		case yaml.ScalarNode:
+			// Store scalar value as written (repeated labels share one copy)
+			s.translations[lang][fullKey] = pool.intern(value.Value)
 		default:
-			// Convert other types to string
+			// Convert other node kinds (sequences, aliases) to string
+			var v interface{}
+			if err := value.Decode(&v); err != nil {
+				return fmt.Errorf("failed to decode %s: %w", fullKey, err)
+			}
 			s.translations[lang][fullKey] = fmt.Sprint(v)
 		}
 	}
+
+	return nil
+}
+
+// intern returns the pooled copy of str, adding it on first use
+func (p stringPool) intern(str string) string {
+	if pooled, ok := p[str]; ok {
+		return pooled
+	}
+	p[str] = str
+	return str
 }
 
 // Translate returns translated text for key in specified language
@@ -149,18 +203,19 @@ func (s *TranslationService) Translate(key, language string) string {
 	s.mu.RLock()
 	defer s.mu.RUnlock()
 
-	// Try requested language
-	if langMap, ok := s.translations[language]; ok {
-		if value, ok := langMap[key]; ok {
-			return value
-		}
-	}
+	return s.lookup(key, language)
+}
 
-	// Fallback to default language
-	if langMap, ok := s.translations[s.defaultLang]; ok {
-		if value, ok := langMap[key]; ok {
-			return value
-		}
+// lookup resolves key for language; the caller must hold s.mu
+func (s *TranslationService) lookup(key, language string) string {
+	// Loaded languages are already merged with default language entries, so a
+	// miss there is a miss in the default language too; only unknown languages fall back
+	langMap, ok := s.translations[language]
+	if !ok {
+		langMap = s.translations[s.defaultLang]
+	}
+	if value, ok := langMap[key]; ok {
+		return value
 	}
 
 	// Last resort: return key itself (makes missing translations visible)
@@ -169,26 +224,42 @@ func (s *TranslationService) Translate(key, language string) string {
 
 // TableCaption returns table caption in specified language
 func (s *TranslationService) TableCaption(tableName, language string) string {
-	// Normalize table name: "Customer Ledger Entry" -> "customer_ledger_entry"
-	normalizedName := normalizeTableName(tableName)
-	key := fmt.Sprintf("tables.%s.caption", normalizedName)
-	return s.Translate(key, language)
+	return s.Translate(s.tableKeyPrefix(tableName)+"caption", language)
 }
 
 // FieldCaption returns field caption in specified language
 func (s *TranslationService) FieldCaption(tableName, fieldName, language string) string {
-	// Normalize table name: "Customer Ledger Entry" -> "customer_ledger_entry"
-	normalizedName := normalizeTableName(tableName)
-	key := fmt.Sprintf("tables.%s.fields.%s", normalizedName, fieldName)
-	return s.Translate(key, language)
+	return s.Translate(s.tableKeyPrefix(tableName)+"fields."+fieldName, language)
+}
+
+// FieldCaptions stores the captions for fieldNames in dest, keyed by field name
+// Resolves the table prefix and takes the read lock once for the whole batch
+func (s *TranslationService) FieldCaptions(tableName string, fieldNames []string, language string, dest map[string]string) {
+	fieldsPrefix := s.tableKeyPrefix(tableName) + "fields."
+
+	s.mu.RLock()
+	defer s.mu.RUnlock()
+
+	for _, fieldName := range fieldNames {
+		dest[fieldName] = s.lookup(fieldsPrefix+fieldName, language)
+	}
 }
 
 // OptionCaption returns option field value caption in specified language
 func (s *TranslationService) OptionCaption(tableName, fieldName, optionValue, language string) string {
-	// Normalize table name: "Customer Ledger Entry" -> "customer_ledger_entry"
-	normalizedName := normalizeTableName(tableName)
-	key := fmt.Sprintf("tables.%s.options.%s.%s", normalizedName, fieldName, optionValue)
-	return s.Translate(key, language)
+	return s.Translate(s.tableKeyPrefix(tableName)+"options."+fieldName+"."+optionValue, language)
+}
+
+// tableKeyPrefix returns the memoized "tables.<normalized>." key prefix for a table
+// Normalize table name: "Customer Ledger Entry" -> "tables.customer_ledger_entry."
+func (s *TranslationService) tableKeyPrefix(tableName string) string {
+	if prefix, ok := s.tablePrefixes.Load(tableName); ok {
+		return prefix.(string)
+	}
+
+	prefix := "tables." + normalizeTableName(tableName) + "."
+	s.tablePrefixes.Store(tableName, prefix)
+	return prefix
 }
 
 // GetSupportedLanguages returns list of available languages
@@ -208,29 +279,6 @@ func (s *TranslationService) GetDefaultLanguage() string {
 	return s.defaultLang
 }
 
-// findProjectRoot finds the project root directory
-func findProjectRoot() (string, error) {
-	// Start from current working directory
-	dir, err := os.Getwd()
-	if err != nil {
-		return "", err
-	}
-
-	// Walk up until we find go.mod
-	for {
-		if _, err := os.Stat(filepath.Join(dir, "go.mod")); err == nil {
-			return dir, nil
-		}
-
-		parent := filepath.Dir(dir)
-		if parent == dir {
-			// Reached root without finding go.mod
-			return "", fmt.Errorf("project root not found (no go.mod)")
-		}
-		dir = parent
-	}
-}
-
 // normalizeTableName converts table names to snake_case for translation lookup
 // Examples: "Customer" -> "customer", "Payment Terms" -> "payment_terms", "Customer Ledger Entry" -> "customer_ledger_entry"
 func normalizeTableName(tableName string) string {
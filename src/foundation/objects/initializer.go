@@ -2,6 +2,7 @@ package objects
 
 import (
 	"database/sql"
+	"errors"
 	"fmt"
 	"regexp"
 	"strings"
@@ -9,22 +10,84 @@ import (
 	"github.com/hansjlachmann/openerp/src/foundation/database"
 )
 
+// primaryKeyPattern matches an inline PRIMARY KEY clause in a column definition
+var primaryKeyPattern = regexp.MustCompile(`(?i)\s+PRIMARY KEY`)
+
 // TableDefinition represents a table that can be initialized
 type TableDefinition interface {
 	GetTableID() int
 	GetTableName() string
 	GetTableSchema() string
+	GetTableKeys() map[string][]string
 	CreateTable(db database.Executor, company string) error
 }
 
 // InitializeCompanyTables creates all registered tables for a new company
 // Also performs schema migration by adding missing columns to existing tables
 func (or *ObjectRegistry) InitializeCompanyTables(db *sql.DB, companyName string) error {
+	// Run all creates and migrations in one transaction so SQLite commits once
+	tx, err := db.Begin()
+	if err != nil {
+		return fmt.Errorf("failed to begin transaction: %w", err)
+	}
+	defer tx.Rollback()
+
+	created, migrated, initErr := or.InitializeCompanyTablesTx(tx, companyName)
+
+	// Keep the tables that succeeded, matching the previous per-statement behavior
+	if err := tx.Commit(); err != nil {
+		commitErr := fmt.Errorf("failed to commit table initialization: %w", err)
+		if initErr != nil {
+			return errors.Join(initErr, commitErr)
+		}
+		return commitErr
+	}
+
+	if initErr != nil {
+		return initErr
+	}
+
+	// Report only once the changes are committed
+	if created > 0 {
+		fmt.Printf("✓ Created %d new table(s)\n", created)
+	}
+	if migrated > 0 {
+		fmt.Printf("✓ Migrated %d existing table(s)\n", migrated)
+	}
+
+	return nil
+}
+
+// InitializeCompanyTablesTx creates and migrates all registered tables using the
+// caller's transaction, so callers can make table setup atomic with their own writes
+// Returns the number of tables created and migrated
+func (or *ObjectRegistry) InitializeCompanyTablesTx(tx database.Executor, companyName string) (int, int, error) {
+	// Load the company's existing tables in one query instead of probing each table
+	existingTables, err := getCompanyTables(tx, companyName)
+	if err != nil {
+		return 0, 0, fmt.Errorf("failed to list existing tables: %w", err)
+	}
+
+	return or.initializeTables(tx, companyName, existingTables)
+}
+
+// CreateCompanyTablesTx creates all registered tables for a company that was just
+// inserted in the same transaction. A new company has no tables to migrate, so the
+// schema lookup is skipped (CreateTable still uses IF NOT EXISTS)
+// Returns the number of tables created
+func (or *ObjectRegistry) CreateCompanyTablesTx(tx database.Executor, companyName string) (int, error) {
+	created, _, err := or.initializeTables(tx, companyName, nil)
+	return created, err
+}
+
+// initializeTables creates each registered table missing from existingTables and
+// migrates the ones present, returning the created and migrated table counts
+func (or *ObjectRegistry) initializeTables(tx database.Executor, companyName string, existingTables map[string]bool) (int, int, error) {
 	// Get all registered table IDs
 	tableIDs := or.ListTables()
 
 	if len(tableIDs) == 0 {
-		return fmt.Errorf("no tables registered in object registry")
+		return 0, 0, fmt.Errorf("no tables registered in object registry")
 	}
 
 	successCount := 0
@@ -49,41 +112,48 @@ func (or *ObjectRegistry) InitializeCompanyTables(db *sql.DB, companyName string
 		// Build full table name (Company$TableName)
 		fullTableName := fmt.Sprintf("%s$%s", companyName, tableDef.GetTableName())
 
-		// Check if table exists
-		exists, err := tableExists(db, fullTableName)
-		if err != nil {
-			failedTables = append(failedTables, fmt.Sprintf("Table %d (%s): failed to check existence: %v", tableID, tableDef.GetTableName(), err))
-			continue
-		}
-
-		if exists {
+		if existingTables[fullTableName] {
 			// Table exists - perform schema migration (add missing columns)
-			schema := tableDef.GetTableSchema()
-			schemaColumns := parseSchemaColumns(schema)
-			existingColumns, err := getTableColumns(db, fullTableName)
+			schemaColumns := or.getSchemaColumns(tableID, tableDef)
+			existingColumns, err := getTableColumns(tx, fullTableName)
 			if err != nil {
 				failedTables = append(failedTables, fmt.Sprintf("Table %d (%s): failed to get columns: %v", tableID, tableDef.GetTableName(), err))
 				continue
 			}
 
 			// Add missing columns
-			err = addMissingColumns(db, fullTableName, schemaColumns, existingColumns)
+			err = addMissingColumns(tx, fullTableName, schemaColumns, existingColumns)
 			if err != nil {
 				failedTables = append(failedTables, fmt.Sprintf("Table %d (%s): migration failed: %v", tableID, tableDef.GetTableName(), err))
 				continue
 			}
 
 			// Also fix any existing NULL values in TEXT/INTEGER columns
-			err = fixNullValues(db, fullTableName, schemaColumns, existingColumns)
+			err = fixNullValues(tx, fullTableName, schemaColumns, existingColumns)
 			if err != nil {
 				failedTables = append(failedTables, fmt.Sprintf("Table %d (%s): failed to fix NULL values: %v", tableID, tableDef.GetTableName(), err))
 				continue
 			}
 
+			// Drop keys whose fields changed since the index was created
+			err = dropChangedKeys(tx, fullTableName, tableDef.GetTableKeys())
+			if err != nil {
+				failedTables = append(failedTables, fmt.Sprintf("Table %d (%s): failed to update keys: %v", tableID, tableDef.GetTableName(), err))
+				continue
+			}
+
+			// Create any keys (indexes) added or dropped above
+			// CreateTable uses IF NOT EXISTS, so existing table and indexes are left untouched
+			err = tableDef.CreateTable(tx, companyName)
+			if err != nil {
+				failedTables = append(failedTables, fmt.Sprintf("Table %d (%s): failed to create keys: %v", tableID, tableDef.GetTableName(), err))
+				continue
+			}
+
 			migratedCount++
 		} else {
 			// Table doesn't exist - create it
-			err := tableDef.CreateTable(db, companyName)
+			err := tableDef.CreateTable(tx, companyName)
 			if err != nil {
 				failedTables = append(failedTables, fmt.Sprintf("Table %d (%s): %v", tableID, tableDef.GetTableName(), err))
 				continue
@@ -98,25 +168,21 @@ func (or *ObjectRegistry) InitializeCompanyTables(db *sql.DB, companyName string
 		for _, failure := range failedTables {
 			errorMsg += "  - " + failure + "\n"
 		}
-		return fmt.Errorf(errorMsg)
+		return successCount, migratedCount, fmt.Errorf(errorMsg)
 	}
 
 	if successCount == 0 && migratedCount == 0 {
-		return fmt.Errorf("no tables were initialized (registered tables may not implement TableDefinition interface)")
+		return 0, 0, fmt.Errorf("no tables were initialized (registered tables may not implement TableDefinition interface)")
 	}
 
-	if successCount > 0 {
-		fmt.Printf("✓ Created %d new table(s)\n", successCount)
-	}
-	if migratedCount > 0 {
-		fmt.Printf("✓ Migrated %d existing table(s)\n", migratedCount)
-	}
-
-	return nil
+	return successCount, migratedCount, nil
 }
 
 // fixNullValues updates NULL values in existing columns to appropriate defaults
-func fixNullValues(db *sql.DB, tableName string, schemaColumns map[string]string, existingColumns map[string]bool) error {
+// All columns are fixed with a single UPDATE statement per table
+func fixNullValues(db database.Executor, tableName string, schemaColumns map[string]string, existingColumns map[string]bool) error {
+	var setClauses, nullChecks []string
+
 	for columnName, columnDef := range schemaColumns {
 		// Skip if column doesn't exist yet
 		if !existingColumns[columnName] {
@@ -125,21 +191,29 @@ func fixNullValues(db *sql.DB, tableName string, schemaColumns map[string]string
 
 		// Determine default value based on type
 		var defaultValue string
-		if strings.Contains(strings.ToUpper(columnDef), "TEXT") {
+		upperDef := strings.ToUpper(columnDef)
+		if strings.Contains(upperDef, "TEXT") {
 			defaultValue = "''"
-		} else if strings.Contains(strings.ToUpper(columnDef), "INTEGER") {
+		} else if strings.Contains(upperDef, "INTEGER") {
 			defaultValue = "0"
 		}
 
 		if defaultValue != "" {
-			updateSQL := fmt.Sprintf(`UPDATE "%s" SET %s = %s WHERE %s IS NULL`, tableName, columnName, defaultValue, columnName)
-			_, err := db.Exec(updateSQL)
-			if err != nil {
-				return fmt.Errorf("failed to fix NULL values for column %s: %w", columnName, err)
-			}
+			setClauses = append(setClauses, fmt.Sprintf("%s = IFNULL(%s, %s)", columnName, columnName, defaultValue))
+			nullChecks = append(nullChecks, columnName+" IS NULL")
 		}
 	}
 
+	if len(setClauses) == 0 {
+		return nil
+	}
+
+	updateSQL := fmt.Sprintf(`UPDATE %s SET %s WHERE %s`, database.QuoteIdentifier(tableName),
+		strings.Join(setClauses, ", "), strings.Join(nullChecks, " OR "))
+	if _, err := db.Exec(updateSQL); err != nil {
+		return fmt.Errorf("failed to fix NULL values: %w", err)
+	}
+
 	return nil
 }
 
@@ -152,26 +226,35 @@ func (or *ObjectRegistry) GetTableCount() int {
 // Schema Migration Helpers
 // ========================================
 
-// tableExists checks if a table exists in the database
-func tableExists(db *sql.DB, tableName string) (bool, error) {
-	var name string
-	err := db.QueryRow(`
+// getCompanyTables returns the set of existing table names prefixed with "Company$"
+func getCompanyTables(db database.Executor, companyName string) (map[string]bool, error) {
+	// Filter by prefix in SQL so only this company's rows are streamed back,
+	// however many companies share the database (substr avoids LIKE wildcards)
+	rows, err := db.Query(`
 		SELECT name FROM sqlite_master
-		WHERE type='table' AND name=?
-	`, tableName).Scan(&name)
-
-	if err == sql.ErrNoRows {
-		return false, nil
-	}
+		WHERE type='table' AND substr(name, 1, length(?1)) = ?1
+	`, companyName+"$")
 	if err != nil {
-		return false, err
+		return nil, err
+	}
+	defer rows.Close()
+
+	tables := make(map[string]bool)
+	for rows.Next() {
+		var name string
+		if err := rows.Scan(&name); err != nil {
+			return nil, err
+		}
+		tables[name] = true
 	}
-	return true, nil
+
+	return tables, rows.Err()
 }
 
 // getTableColumns returns a map of existing column names in the table
-func getTableColumns(db *sql.DB, tableName string) (map[string]bool, error) {
-	rows, err := db.Query(fmt.Sprintf(`PRAGMA table_info("%s")`, tableName))
+func getTableColumns(db database.Executor, tableName string) (map[string]bool, error) {
+	// Only column names are needed, so select the single column from pragma_table_info
+	rows, err := db.Query(`SELECT name FROM pragma_table_info(?)`, tableName)
 	if err != nil {
 		return nil, fmt.Errorf("failed to get table info: %w", err)
 	}
@@ -179,21 +262,62 @@ func getTableColumns(db *sql.DB, tableName string) (map[string]bool, error) {
 
 	columns := make(map[string]bool)
 	for rows.Next() {
-		var cid int
 		var name string
-		var dataType string
-		var notNull int
-		var defaultValue sql.NullString
-		var pk int
-
-		err := rows.Scan(&cid, &name, &dataType, &notNull, &defaultValue, &pk)
-		if err != nil {
+		if err := rows.Scan(&name); err != nil {
 			return nil, fmt.Errorf("failed to scan column info: %w", err)
 		}
 		columns[strings.ToLower(name)] = true
 	}
 
-	return columns, nil
+	return columns, rows.Err()
+}
+
+// dropChangedKeys drops indexes whose columns no longer match the table's key
+// definition, so CreateTable recreates them with the current fields
+func dropChangedKeys(db database.Executor, tableName string, keys map[string][]string) error {
+	for keyName, fields := range keys {
+		indexName := tableName + "$" + keyName
+		columns, err := database.GetIndexColumns(db, indexName)
+		if err != nil {
+			return err
+		}
+
+		// Missing indexes are created by CreateTable; matching ones are kept
+		if len(columns) == 0 || sameColumns(columns, fields) {
+			continue
+		}
+
+		if _, err := db.Exec(`DROP INDEX IF EXISTS ` + database.QuoteIdentifier(indexName)); err != nil {
+			return fmt.Errorf("failed to drop index %s: %w", indexName, err)
+		}
+	}
+
+	return nil
+}
+
+// sameColumns reports whether two column lists match in order (case-insensitive)
+func sameColumns(a, b []string) bool {
+	if len(a) != len(b) {
+		return false
+	}
+	for i := range a {
+		if !strings.EqualFold(a[i], b[i]) {
+			return false
+		}
+	}
+	return true
+}
+
+// getSchemaColumns returns the parsed schema of a registered table
+// Schemas are static per table, so they are parsed once and reused for every company
+func (or *ObjectRegistry) getSchemaColumns(tableID int, tableDef TableDefinition) map[string]string {
+	if columns, ok := or.schemaColumns[tableID]; ok {
+		return columns
+	}
+
+	columns := parseSchemaColumns(tableDef.GetTableSchema())
+	or.schemaColumns[tableID] = columns
+	return columns
 }
 
 // parseSchemaColumns extracts column definitions from CREATE TABLE schema
@@ -236,7 +360,7 @@ func parseSchemaColumns(schema string) map[string]string {
 }
 
 // addMissingColumns adds columns that exist in schema but not in table
-func addMissingColumns(db *sql.DB, tableName string, schemaColumns map[string]string, existingColumns map[string]bool) error {
+func addMissingColumns(db database.Executor, tableName string, schemaColumns map[string]string, existingColumns map[string]bool) error {
 	addedCount := 0
 
 	for columnName, columnDef := range schemaColumns {
@@ -252,23 +376,22 @@ func addMissingColumns(db *sql.DB, tableName string, schemaColumns map[string]st
 
 		// Remove PRIMARY KEY from column definition for ALTER TABLE
 		// SQLite doesn't allow adding PRIMARY KEY columns via ALTER TABLE
-		cleanDef := columnDef
-		re := regexp.MustCompile(`(?i)\s+PRIMARY KEY`)
-		cleanDef = re.ReplaceAllString(cleanDef, "")
+		cleanDef := primaryKeyPattern.ReplaceAllString(columnDef, "")
+		upperDef := strings.ToUpper(cleanDef)
 
 		// Add DEFAULT value to prevent NULL values in existing rows
 		// This prevents "converting NULL to string is unsupported" errors
-		if !strings.Contains(strings.ToUpper(cleanDef), "DEFAULT") {
+		if !strings.Contains(upperDef, "DEFAULT") {
 			// Determine default value based on type
-			if strings.Contains(strings.ToUpper(cleanDef), "TEXT") {
+			if strings.Contains(upperDef, "TEXT") {
 				cleanDef = cleanDef + " DEFAULT ''"
-			} else if strings.Contains(strings.ToUpper(cleanDef), "INTEGER") {
+			} else if strings.Contains(upperDef, "INTEGER") {
 				cleanDef = cleanDef + " DEFAULT 0"
 			}
 		}
 
 		// Execute ALTER TABLE ADD COLUMN
-		alterSQL := fmt.Sprintf(`ALTER TABLE "%s" ADD COLUMN %s`, tableName, cleanDef)
+		alterSQL := fmt.Sprintf(`ALTER TABLE %s ADD COLUMN %s`, database.QuoteIdentifier(tableName), cleanDef)
 		_, err := db.Exec(alterSQL)
 		if err != nil {
 			return fmt.Errorf("failed to add column %s: %w", columnName, err)
@@ -276,14 +399,14 @@ func addMissingColumns(db *sql.DB, tableName string, schemaColumns map[string]st
 
 		// Update existing rows to set default value (ALTER TABLE DEFAULT doesn't update existing rows)
 		var defaultValue string
-		if strings.Contains(strings.ToUpper(cleanDef), "TEXT") {
+		if strings.Contains(upperDef, "TEXT") {
 			defaultValue = "''"
-		} else if strings.Contains(strings.ToUpper(cleanDef), "INTEGER") {
+		} else if strings.Contains(upperDef, "INTEGER") {
 			defaultValue = "0"
 		}
 
 		if defaultValue != "" {
-			updateSQL := fmt.Sprintf(`UPDATE "%s" SET %s = %s WHERE %s IS NULL`, tableName, columnName, defaultValue, columnName)
+			updateSQL := fmt.Sprintf(`UPDATE %s SET %s = %s WHERE %s IS NULL`, database.QuoteIdentifier(tableName), columnName, defaultValue, columnName)
 			_, err = db.Exec(updateSQL)
 			if err != nil {
 				return fmt.Errorf("failed to update default values for column %s: %w", columnName, err)
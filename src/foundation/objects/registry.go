@@ -13,6 +13,8 @@ type ObjectRegistry struct {
 	pages     map[int]interface{}
 	reports   map[int]interface{}
 	codeunits map[int]interface{}
+
+	schemaColumns map[int]map[string]string // Parsed table schemas, cached for schema sync
 }
 
 // NewObjectRegistry creates a new object registry
@@ -22,6 +24,8 @@ func NewObjectRegistry() *ObjectRegistry {
 		pages:     make(map[int]interface{}),
 		reports:   make(map[int]interface{}),
 		codeunits: make(map[int]interface{}),
+
+		schemaColumns: make(map[int]map[string]string),
 	}
 }
 
@@ -7,6 +7,8 @@ import (
 	"sync"
 
 	"gopkg.in/yaml.v3"
+
+	"github.com/hansjlachmann/openerp/src/foundation/config"
 )
 
 // Registry manages page definitions
@@ -45,7 +47,7 @@ func (r *Registry) LoadPages() error {
 	defer r.mu.Unlock()
 
 	// Get project root
-	rootPath, err := findProjectRoot()
+	rootPath, err := config.FindProjectRoot()
 	if err != nil {
 		return fmt.Errorf("failed to find project root: %w", err)
 	}
@@ -92,19 +94,46 @@ func (r *Registry) loadPageFile(filePath string) error {
 		return fmt.Errorf("failed to parse YAML: %w", err)
 	}
 
+	// Primary key flags only depend on the table definition, so set them once here
+	// instead of on every page request
+	markPrimaryKeyFields(&pageDef)
+
 	// Store by page ID
 	r.pages[pageDef.Page.ID] = &pageDef
 
 	return nil
 }
 
+// markPrimaryKeyFields flags the page fields bound to the source table's primary key
+func markPrimaryKeyFields(pageDef *PageDefinition) {
+	if pageDef.Page.SourceTable == "" {
+		return
+	}
+
+	primaryKeyField := GetTableMetadata().GetPrimaryKeyField(pageDef.Page.SourceTable)
+
+	for i := range pageDef.Page.Layout.Sections {
+		fields := pageDef.Page.Layout.Sections[i].Fields
+		for j := range fields {
+			fields[j].PrimaryKey = fields[j].Source == primaryKeyField
+		}
+	}
+
+	if pageDef.Page.Layout.Repeater != nil {
+		fields := pageDef.Page.Layout.Repeater.Fields
+		for j := range fields {
+			fields[j].PrimaryKey = fields[j].Source == primaryKeyField
+		}
+	}
+}
+
 // LoadMenu loads the menu definition
 func (r *Registry) LoadMenu() error {
 	r.mu.Lock()
 	defer r.mu.Unlock()
 
 	// Get project root
-	rootPath, err := findProjectRoot()
+	rootPath, err := config.FindProjectRoot()
 	if err != nil {
 		return fmt.Errorf("failed to find project root: %w", err)
 	}
@@ -180,26 +209,3 @@ func (r *Registry) GetAllPages() map[int]*PageDefinition {
 
 	return pages
 }
-
-// findProjectRoot finds the project root directory
-func findProjectRoot() (string, error) {
-	// Start from current working directory
-	dir, err := os.Getwd()
-	if err != nil {
-		return "", err
-	}
-
-	// Walk up until we find go.mod
-	for {
-		if _, err := os.Stat(filepath.Join(dir, "go.mod")); err == nil {
-			return dir, nil
-		}
-
-		parent := filepath.Dir(dir)
-		if parent == dir {
-			// Reached root without finding go.mod
-			return "", fmt.Errorf("project root not found (no go.mod)")
-		}
-		dir = parent
-	}
-}
@@ -7,6 +7,8 @@ import (
 	"sync"
 
 	"gopkg.in/yaml.v3"
+
+	"github.com/hansjlachmann/openerp/src/foundation/config"
 )
 
 // TableMetadata holds metadata about tables for page rendering
@@ -52,7 +54,7 @@ func (tm *TableMetadata) Load() error {
 	tm.mu.Lock()
 	defer tm.mu.Unlock()
 
-	rootPath, err := findProjectRoot()
+	rootPath, err := config.FindProjectRoot()
 	if err != nil {
 		return fmt.Errorf("failed to find project root: %w", err)
 	}
@@ -22,6 +22,15 @@ func NewDateTimeFromTime(t time.Time) DateTime {
 	return DateTime{t.UTC()}
 }
 
+// dateTimeFormats lists the accepted datetime layouts, tried in order
+var dateTimeFormats = []string{
+	time.RFC3339,                 // "2006-01-02T15:04:05Z07:00"
+	time.RFC3339Nano,             // "2006-01-02T15:04:05.999999999Z07:00"
+	"2006-01-02 15:04:05",        // SQLite datetime format
+	"2006-01-02T15:04:05",        // ISO 8601 without timezone
+	"2006-01-02 15:04:05.999999", // SQLite with microseconds
+}
+
 // NewDateTimeFromString parses a datetime string in ISO 8601 format
 func NewDateTimeFromString(value string) (DateTime, error) {
 	if value == "" {
@@ -29,17 +38,9 @@ func NewDateTimeFromString(value string) (DateTime, error) {
 	}
 
 	// Try multiple formats
-	formats := []string{
-		time.RFC3339,                 // "2006-01-02T15:04:05Z07:00"
-		time.RFC3339Nano,             // "2006-01-02T15:04:05.999999999Z07:00"
-		"2006-01-02 15:04:05",        // SQLite datetime format
-		"2006-01-02T15:04:05",        // ISO 8601 without timezone
-		"2006-01-02 15:04:05.999999", // SQLite with microseconds
-	}
-
 	var t time.Time
 	var err error
-	for _, format := range formats {
+	for _, format := range dateTimeFormats {
 		t, err = time.Parse(format, value)
 		if err == nil {
 			return DateTime{t.UTC()}, nil
@@ -31,17 +31,7 @@ func NewManager(db *database.Database) *Manager {
 
 // InitializeUserTable creates the global User table (called once per database)
 func InitializeUserTable(db *sql.DB) error {
-	createSQL := `
-		CREATE TABLE IF NOT EXISTS "User" (
-			username TEXT PRIMARY KEY,
-			password_hash TEXT NOT NULL,
-			full_name TEXT,
-			language TEXT DEFAULT 'en-US',
-			active INTEGER DEFAULT 1
-		)
-	`
-
-	_, err := db.Exec(createSQL)
+	_, err := db.Exec(database.UserTableSQL)
 	if err != nil {
 		return fmt.Errorf("failed to create User table: %w", err)
 	}
@@ -88,13 +78,13 @@ func (m *Manager) GetUser(username string) (*User, error) {
 	}
 
 	var user User
-	var active int
 
+	// active is stored as 0/1, which database/sql converts straight into the bool field
 	err := m.db.GetConnection().QueryRow(`
 		SELECT username, password_hash, full_name, language, active
 		FROM "User"
 		WHERE username = ?
-	`, username).Scan(&user.Username, &user.PasswordHash, &user.FullName, &user.Language, &active)
+	`, username).Scan(&user.Username, &user.PasswordHash, &user.FullName, &user.Language, &user.Active)
 
 	if err == sql.ErrNoRows {
 		return nil, fmt.Errorf("user '%s' not found", username)
@@ -103,8 +93,6 @@ func (m *Manager) GetUser(username string) (*User, error) {
 		return nil, fmt.Errorf("failed to get user: %w", err)
 	}
 
-	user.Active = active != 0
-
 	return &user, nil
 }
 
@@ -126,15 +114,14 @@ func (m *Manager) ListUsers() ([]*User, error) {
 
 	var users []*User
 	for rows.Next() {
-		var user User
-		var active int
-
-		if err := rows.Scan(&user.Username, &user.PasswordHash, &user.FullName, &user.Language, &active); err != nil {
+		user := &User{}
+		if err := rows.Scan(&user.Username, &user.PasswordHash, &user.FullName, &user.Language, &user.Active); err != nil {
 			return nil, fmt.Errorf("failed to scan user: %w", err)
 		}
-
-		user.Active = active != 0
-		users = append(users, &user)
+		users = append(users, user)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, fmt.Errorf("failed to list users: %w", err)
 	}
 
 	return users, nil
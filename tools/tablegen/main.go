@@ -117,6 +117,18 @@ func main() {
 
 	fmt.Printf("Found %d table definition(s)\n", len(yamlFiles))
 
+	// Parse templates once and reuse them for every table definition
+	genTmpl, err := template.New("gen").Funcs(templateFuncs()).Parse(boilerplateTemplate)
+	if err != nil {
+		fmt.Printf("Error parsing boilerplate template: %v\n", err)
+		os.Exit(1)
+	}
+	businessTmpl, err := template.New("business").Funcs(templateFuncs()).Parse(businessTemplate)
+	if err != nil {
+		fmt.Printf("Error parsing business logic template: %v\n", err)
+		os.Exit(1)
+	}
+
 	for _, yamlFile := range yamlFiles {
 		fmt.Printf("\nProcessing: %s\n", filepath.Base(yamlFile))
 
@@ -132,7 +144,7 @@ func main() {
 
 		// Generate *_gen.go (always regenerate)
 		genFile := filepath.Join(tablesDir, strings.ToLower(data.StructName)+"_gen.go")
-		if err := generateBoilerplate(genFile, data); err != nil {
+		if err := generateBoilerplate(genTmpl, genFile, data); err != nil {
 			fmt.Printf("  ✗ Error generating boilerplate: %v\n", err)
 			continue
 		}
@@ -141,7 +153,7 @@ func main() {
 		// Generate *.go skeleton (only if doesn't exist)
 		businessFile := filepath.Join(tablesDir, strings.ToLower(data.StructName)+".go")
 		if !fileExists(businessFile) {
-			if err := generateBusinessLogicSkeleton(businessFile, data); err != nil {
+			if err := generateBusinessLogicSkeleton(businessTmpl, businessFile, data); err != nil {
 				fmt.Printf("  ✗ Error generating skeleton: %v\n", err)
 				continue
 			}
@@ -222,12 +234,7 @@ func fileExists(filename string) bool {
 }
 
 // generateBoilerplate generates the *_gen.go file
-func generateBoilerplate(filename string, data TemplateData) error {
-	tmpl, err := template.New("gen").Funcs(templateFuncs()).Parse(boilerplateTemplate)
-	if err != nil {
-		return err
-	}
-
+func generateBoilerplate(tmpl *template.Template, filename string, data TemplateData) error {
 	f, err := os.Create(filename)
 	if err != nil {
 		return err
@@ -238,12 +245,7 @@ func generateBoilerplate(filename string, data TemplateData) error {
 }
 
 // generateBusinessLogicSkeleton generates the *.go skeleton file
-func generateBusinessLogicSkeleton(filename string, data TemplateData) error {
-	tmpl, err := template.New("business").Funcs(templateFuncs()).Parse(businessTemplate)
-	if err != nil {
-		return err
-	}
-
+func generateBusinessLogicSkeleton(tmpl *template.Template, filename string, data TemplateData) error {
 	f, err := os.Create(filename)
 	if err != nil {
 		return err
@@ -476,11 +478,13 @@ import (
 // {{ $.StructName }}{{ upperFirst .Name }} represents the {{ .Name }} option field
 type {{ $.StructName }}{{ upperFirst .Name }} int
 
+// {{ lowerFirst $.StructName }}{{ upperFirst .Name }}Options holds the option texts, built once at package init
+var {{ lowerFirst $.StructName }}{{ upperFirst .Name }}Options = []string{ {{- range $i, $opt := .Options }}{{- if $i }}, {{ end }}"{{ $opt }}"{{- end }}}
+
 // String returns the text representation of {{ $.StructName }}{{ upperFirst .Name }}
 func (o {{ $.StructName }}{{ upperFirst .Name }}) String() string {
-	options := []string{ {{- range $i, $opt := .Options }}{{- if $i }}, {{ end }}"{{ $opt }}"{{- end }} }
-	if o >= 0 && int(o) < len(options) {
-		return options[o]
+	if o >= 0 && int(o) < len({{ lowerFirst $.StructName }}{{ upperFirst .Name }}Options) {
+		return {{ lowerFirst $.StructName }}{{ upperFirst .Name }}Options[o]
 	}
 	return ""
 }
@@ -507,8 +511,9 @@ type {{ .StructName }} struct {
 {{- end }}
 
 	// Internal context (set by Init)
-	db      database.Executor
-	company string
+	db        database.Executor
+	company   string
+	tableName string // Company$TableName, built once instead of per statement
 
 	// Field tracking for optimal Modify() operations
 	oldValues map[string]interface{} // Stores original values from Get()
@@ -521,7 +526,7 @@ type {{ .StructName }} struct {
 	orderByFields []string
 
 	// Buffered recordset for bidirectional navigation (BC/NAV style)
-	bufferedRecords []*{{ .StructName }}
+	bufferedRecords []{{ .StructName }}
 	currentBufferPos int
 }
 
@@ -575,6 +580,19 @@ func Get{{ .StructName }}TableSchema() string {
 	` + "`" + `
 }
 
+// GetTableKeys returns the table's keys (indexes) by name with their fields in order
+func (t *{{ .StructName }}) GetTableKeys() map[string][]string {
+{{- if .Table.Keys }}
+	return map[string][]string{
+{{- range .Table.Keys }}
+		"{{ .Name }}": { {{- range $i, $f := .Fields }}{{ if $i }}, {{ end }}"{{ $f }}"{{ end }}},
+{{- end }}
+	}
+{{- else }}
+	return nil
+{{- end }}
+}
+
 // ========================================
 // Translation Support (BC/NAV CaptionML)
 // ========================================
@@ -602,28 +620,27 @@ func (t *{{ .StructName }}) GetOptionCaption(fieldName, optionValue, language st
 // CreateTable creates the {{ .Table.Name }} table for the specified company
 // The db parameter can be either *sql.DB or *sql.Tx
 func (t *{{ .StructName }}) CreateTable(db database.Executor, company string) error {
-	tableName := fmt.Sprintf("%s$%s", company, {{ .StructName }}TableName)
+	tableName := company + "$" + {{ .StructName }}TableName
+	if err := database.ValidateTableName(tableName); err != nil {
+		return err
+	}
 	schema := Get{{ .StructName }}TableSchema()
 
-	createSQL := fmt.Sprintf(` + "`CREATE TABLE IF NOT EXISTS \"%s\" (%s)`" + `, tableName, schema)
-	_, err := db.Exec(createSQL)
-	if err != nil {
-		return fmt.Errorf("failed to create {{ .Table.Name }} table: %w", err)
-	}
+	createSQL := fmt.Sprintf(` + "`CREATE TABLE IF NOT EXISTS %s (%s);`" + `, database.QuoteIdentifier(tableName), schema)
 
-	// Create indexes (BC/NAV Keys)
 {{- if .Table.Keys }}
-	var indexName, indexSQL string
+
+	// Create indexes (BC/NAV Keys) in the same batch as the table
+{{- end }}
 {{- range .Table.Keys }}
-	indexName = fmt.Sprintf("%s${{ $.Table.Name }}${{ .Name }}", company)
-	indexSQL = fmt.Sprintf(` + "`CREATE INDEX IF NOT EXISTS \"%s\" ON \"%s\" ({{ join .Fields \", \" }})`" + `,
-		indexName, tableName)
-	_, err = db.Exec(indexSQL)
+	createSQL += fmt.Sprintf(` + "` CREATE INDEX IF NOT EXISTS %s ON %s ({{ join .Fields \", \" }});`" + `,
+		database.QuoteIdentifier(tableName+"${{ .Name }}"), database.QuoteIdentifier(tableName))
+{{- end }}
+
+	_, err := db.Exec(createSQL)
 	if err != nil {
-		return fmt.Errorf("failed to create index {{ .Name }}: %w", err)
+		return fmt.Errorf("failed to create {{ .Table.Name }} table: %w", err)
 	}
-{{- end }}
-{{- end }}
 
 	return nil
 }
@@ -638,6 +655,7 @@ func (t *{{ .StructName }}) CreateTable(db database.Executor, company string) er
 func (t *{{ .StructName }}) Init(db database.Executor, company string) {
 	t.db = db
 	t.company = company
+	t.tableName = company + "$" + {{ .StructName }}TableName
 	t.oldValues = nil // Fresh record, no old values
 
 {{- range .Table.Fields }}
@@ -652,7 +670,10 @@ func (t *{{ .StructName }}) Init(db database.Executor, company string) {
 // StoreOldValues stores current field values for change detection
 // Call this after loading a record from the database
 func (t *{{ .StructName }}) StoreOldValues() {
-	t.oldValues = make(map[string]interface{})
+	// Reuse the existing map: the key set is fixed, so every entry is overwritten
+	if t.oldValues == nil {
+		t.oldValues = make(map[string]interface{}, {{ len .Table.Fields }})
+	}
 {{- range .Table.Fields }}
 {{- if not .FlowField }}
 	t.oldValues["{{ .DBName }}"] = t.{{ upperFirst .Name }}
@@ -662,7 +683,7 @@ func (t *{{ .StructName }}) StoreOldValues() {
 
 // Get retrieves a record from the database by primary key
 func (t *{{ .StructName }}) Get({{- range $i, $f := .Table.Fields }}{{- if $f.PrimaryKey }}{{ lowerFirst $f.Name }} {{ $f.Type }}{{ if not (isLastPK $i $.Table.Fields) }}, {{ end }}{{- end }}{{- end }}) bool {
-	tableName := fmt.Sprintf("%s$%s", t.company, {{ .StructName }}TableName)
+	tableName := t.tableName
 
 	{{- range .Table.Fields }}
 	{{- if not .FlowField }}
@@ -754,6 +775,29 @@ func (t *{{ .StructName }}) Get({{- range $i, $f := .Table.Fields }}{{- if $f.Pr
 	return true
 }
 
+// Exists reports whether a record with the given primary key exists
+// Selects a single constant column, so no fields are scanned or converted
+func (t *{{ .StructName }}) Exists({{- range $i, $f := .Table.Fields }}{{- if $f.PrimaryKey }}{{ lowerFirst $f.Name }} {{ $f.Type }}{{ if not (isLastPK $i $.Table.Fields) }}, {{ end }}{{- end }}{{- end }}) bool {
+	tableName := t.tableName
+
+	var found int
+	err := t.db.QueryRow(
+		fmt.Sprintf(` + "`SELECT 1 FROM \"%s\" WHERE 1=1{{ range .Table.Fields }}{{ if .PrimaryKey }} AND {{ .DBName }} = ?{{ end }}{{ end }} LIMIT 1`" + `, tableName),
+		{{- range $i, $f := .Table.Fields }}{{- if $f.PrimaryKey }}
+		{{ lowerFirst $f.Name }},
+		{{- end }}{{- end }}
+	).Scan(&found)
+
+	if err != nil {
+		if err != sql.ErrNoRows {
+			fmt.Printf("Error: Failed to check {{ .Table.Name }}: %v\n", err)
+		}
+		return false
+	}
+
+	return true
+}
+
 // Insert inserts the record into the database
 func (t *{{ .StructName }}) Insert(runTrigger bool) bool {
 	// Call OnInsert trigger if requested
@@ -764,7 +808,7 @@ func (t *{{ .StructName }}) Insert(runTrigger bool) bool {
 		}
 	}
 
-	tableName := fmt.Sprintf("%s$%s", t.company, {{ .StructName }}TableName)
+	tableName := t.tableName
 	_, err := t.db.Exec(
 		fmt.Sprintf(` + "`INSERT INTO \"%s\" ({{ range $i, $f := .Table.Fields }}{{ if not $f.FlowField }}{{ $f.DBName }}{{ if not (isLastDBField $i $.Table.Fields) }}, {{ end }}{{ end }}{{ end }}) VALUES ({{ range $i, $f := .Table.Fields }}{{ if not $f.FlowField }}?{{ if not (isLastDBField $i $.Table.Fields) }}, {{ end }}{{ end }}{{ end }})`" + `, tableName),
 {{- range .Table.Fields }}
@@ -790,11 +834,11 @@ func (t *{{ .StructName }}) Modify(runTrigger bool) bool {
 		}
 	}
 
-	tableName := fmt.Sprintf("%s$%s", t.company, {{ .StructName }}TableName)
+	tableName := t.tableName
 
 	// Build dynamic SQL based on field tracking
-	var setClauses []string
-	var values []interface{}
+	setClauses := make([]string, 0, {{ len .Table.Fields }})
+	values := make([]interface{}, 0, {{ len .Table.Fields }})
 
 	// If we have old values (loaded from Get), only update changed fields
 	if t.oldValues != nil {
@@ -908,7 +952,7 @@ func (t *{{ .StructName }}) Delete(runTrigger bool) bool {
 		}
 	}
 
-	tableName := fmt.Sprintf("%s$%s", t.company, {{ .StructName }}TableName)
+	tableName := t.tableName
 	_, err := t.db.Exec(
 		fmt.Sprintf(` + "`DELETE FROM \"%s\" WHERE {{ range .Table.Fields }}{{ if .PrimaryKey }}{{ .DBName }} = ?{{ end }}{{ end }}`" + `, tableName),
 {{- range .Table.Fields }}
@@ -988,65 +1032,34 @@ func (t *{{ $.StructName }}) calcFlowField_{{ .Name }}() {
 {{- if and .FlowField (eq .CalcFormula "Sum") }}
 
 func (t *{{ $.StructName }}) calcSum{{ upperFirst .SourceTable }}{{ upperFirst .SourceField }}() {{ .Type }} {
-	tableName := fmt.Sprintf("%s$%s", t.company, {{ .SourceTable }}TableName)
+	tableName := t.company + "$" + {{ .SourceTable }}TableName
 
-	// Build WHERE clause from FlowFilters
-	var whereClauses []string
-	var args []interface{}
+	// FlowFilter arguments; the matching WHERE clause is generated into the query text
+	args := []interface{}{ {{- range $i, $ff := .FlowFilters }}{{ if $i }}, {{ end }}{{ if eq $ff.Type "const" }}{{ $ff.Value }}{{ else }}t.{{ upperFirst $ff.Value }}{{ end }}{{- end }}}
 
-	{{- range .FlowFilters }}
-	{{- if eq .Type "const" }}
-	whereClauses = append(whereClauses, "{{ .Field }} = ?")
-	args = append(args, {{ .Value }})
-	{{- else if eq .Type "field" }}
-	whereClauses = append(whereClauses, "{{ .Field }} = ?")
-	args = append(args, t.{{ upperFirst .Value }})
-	{{- end }}
-	{{- end }}
+	query := fmt.Sprintf(` + "`SELECT COALESCE(SUM({{ .SourceField }}), 0) FROM \"%s\" WHERE {{ range $i, $ff := .FlowFilters }}{{ if $i }} AND {{ end }}{{ $ff.Field }} = ?{{ else }}1=1{{ end }}`" + `, tableName)
 
-	whereClause := "1=1"
-	if len(whereClauses) > 0 {
-		whereClause = strings.Join(whereClauses, " AND ")
-	}
-
-	query := fmt.Sprintf(` + "`SELECT COALESCE(SUM({{ .SourceField }}), 0) FROM \"%s\" WHERE %s`" + `, tableName, whereClause)
-
-	var sumStr string
-	err := t.db.QueryRow(query, args...).Scan(&sumStr)
+	// SQLite returns SUM over the TEXT-stored decimals as REAL; scan it as a float
+	// instead of formatting it to a string and parsing that back
+	var sum float64
+	err := t.db.QueryRow(query, args...).Scan(&sum)
 	if err != nil {
 		fmt.Printf("Error: Failed to calculate sum for {{ .Name }}: %v\n", err)
 		return types.ZeroDecimal()
 	}
 
-	sum, _ := types.NewDecimalFromString(sumStr)
-	return sum
+	return types.NewDecimal(sum)
 }
 {{- end }}
 {{- if and .FlowField (eq .CalcFormula "Count") }}
 
 func (t *{{ $.StructName }}) calcCount{{ upperFirst .SourceTable }}() int {
-	tableName := fmt.Sprintf("%s$%s", t.company, {{ .SourceTable }}TableName)
-
-	// Build WHERE clause from FlowFilters
-	var whereClauses []string
-	var args []interface{}
-
-	{{- range .FlowFilters }}
-	{{- if eq .Type "const" }}
-	whereClauses = append(whereClauses, "{{ .Field }} = ?")
-	args = append(args, {{ .Value }})
-	{{- else if eq .Type "field" }}
-	whereClauses = append(whereClauses, "{{ .Field }} = ?")
-	args = append(args, t.{{ upperFirst .Value }})
-	{{- end }}
-	{{- end }}
+	tableName := t.company + "$" + {{ .SourceTable }}TableName
 
-	whereClause := "1=1"
-	if len(whereClauses) > 0 {
-		whereClause = strings.Join(whereClauses, " AND ")
-	}
+	// FlowFilter arguments; the matching WHERE clause is generated into the query text
+	args := []interface{}{ {{- range $i, $ff := .FlowFilters }}{{ if $i }}, {{ end }}{{ if eq $ff.Type "const" }}{{ $ff.Value }}{{ else }}t.{{ upperFirst $ff.Value }}{{ end }}{{- end }}}
 
-	query := fmt.Sprintf(` + "`SELECT COUNT(*) FROM \"%s\" WHERE %s`" + `, tableName, whereClause)
+	query := fmt.Sprintf(` + "`SELECT COUNT(*) FROM \"%s\" WHERE {{ range $i, $ff := .FlowFilters }}{{ if $i }} AND {{ end }}{{ $ff.Field }} = ?{{ else }}1=1{{ end }}`" + `, tableName)
 
 	var count int
 	err := t.db.QueryRow(query, args...).Scan(&count)
@@ -1232,7 +1245,7 @@ func (t *{{ .StructName }}) getOrderByClause() string {
 // FindFirst finds the first record matching current filters (BC/NAV style)
 // Returns true if found, false if not found
 func (t *{{ .StructName }}) FindFirst() bool {
-	tableName := fmt.Sprintf("%s$%s", t.company, {{ .StructName }}TableName)
+	tableName := t.tableName
 	where, args := t.buildWhereClause()
 
 	// Build SELECT with all fields
@@ -1326,7 +1339,7 @@ func (t *{{ .StructName }}) FindFirst() bool {
 // FindLast finds the last record matching current filters (BC/NAV style)
 // Returns true if found, false if not found
 func (t *{{ .StructName }}) FindLast() bool {
-	tableName := fmt.Sprintf("%s$%s", t.company, {{ .StructName }}TableName)
+	tableName := t.tableName
 	where, args := t.buildWhereClause()
 
 	// Build SELECT with all fields
@@ -1419,7 +1432,7 @@ func (t *{{ .StructName }}) FindLast() bool {
 
 // Count returns the number of records matching current filters (BC/NAV style)
 func (t *{{ .StructName }}) Count() int {
-	tableName := fmt.Sprintf("%s$%s", t.company, {{ .StructName }}TableName)
+	tableName := t.tableName
 	where, args := t.buildWhereClause()
 
 	query := fmt.Sprintf(` + "`SELECT COUNT(*) FROM \"%s\" WHERE %s`" + `, tableName, where)
@@ -1444,7 +1457,7 @@ func (t *{{ .StructName }}) FindSet() bool {
 		t.currentRows = nil
 	}
 
-	tableName := fmt.Sprintf("%s$%s", t.company, {{ .StructName }}TableName)
+	tableName := t.tableName
 	where, args := t.buildWhereClause()
 	orderBy := t.getOrderByClause()
 
@@ -1490,7 +1503,7 @@ func (t *{{ .StructName }}) Next(steps ...int) bool {
 
 		// Move to new position
 		t.currentBufferPos = newPos
-		t.copyFromBuffered(t.bufferedRecords[t.currentBufferPos])
+		t.copyFromBuffered(&t.bufferedRecords[t.currentBufferPos])
 		return true
 	}
 
@@ -1616,7 +1629,7 @@ func (t *{{ .StructName }}) FindSetBuffered() bool {
 	t.bufferedRecords = nil
 	t.currentBufferPos = -1
 
-	tableName := fmt.Sprintf("%s$%s", t.company, {{ .StructName }}TableName)
+	tableName := t.tableName
 	where, args := t.buildWhereClause()
 	orderBy := t.getOrderByClause()
 
@@ -1630,12 +1643,11 @@ func (t *{{ .StructName }}) FindSetBuffered() bool {
 	}
 	defer rows.Close()
 
-	// Load all records into memory
+	// Load all records into memory, stored by value in one growing slice
+	// Buffered records only hold field values; copyFromBuffered provides the context
 	for rows.Next() {
-		// Create a new record instance
-		record := &{{ .StructName }}{}
-		record.db = t.db
-		record.company = t.company
+		t.bufferedRecords = append(t.bufferedRecords, {{ .StructName }}{})
+		record := &t.bufferedRecords[len(t.bufferedRecords)-1]
 
 		// Scan the row
 {{- range .Table.Fields }}
@@ -1688,6 +1700,7 @@ func (t *{{ .StructName }}) FindSetBuffered() bool {
 
 		if err != nil {
 			fmt.Printf("Error: Failed to scan {{ .Table.Name }} record: %v\n", err)
+			t.bufferedRecords = nil
 			return false
 		}
 
@@ -1713,17 +1726,12 @@ func (t *{{ .StructName }}) FindSetBuffered() bool {
 {{- end }}
 {{- end }}
 {{- end }}
-
-		// Store old values
-		record.StoreOldValues()
-
-		// Add to buffer
-		t.bufferedRecords = append(t.bufferedRecords, record)
 	}
 
 	// Check for errors during iteration
 	if err := rows.Err(); err != nil {
 		fmt.Printf("Error: Failed to iterate {{ .Table.Name }} records: %v\n", err)
+		t.bufferedRecords = nil
 		return false
 	}
 
@@ -1734,12 +1742,13 @@ func (t *{{ .StructName }}) FindSetBuffered() bool {
 
 	// Load first record into current instance
 	t.currentBufferPos = 0
-	t.copyFromBuffered(t.bufferedRecords[0])
+	t.copyFromBuffered(&t.bufferedRecords[0])
 
 	return true
 }
 
 // copyFromBuffered copies field values from a buffered record to the current instance
+// Old values are captured here, for the record that is actually current
 func (t *{{ .StructName }}) copyFromBuffered(record *{{ .StructName }}) {
 {{- range .Table.Fields }}
 	t.{{ upperFirst .Name }} = record.{{ upperFirst .Name }}
@@ -1752,14 +1761,29 @@ func (t *{{ .StructName }}) copyFromBuffered(record *{{ .StructName }}) {
 // ========================================
 
 // IsEmpty returns true if no records match current filters (BC/NAV style)
+// Stops at the first matching row instead of counting the whole result set
 func (t *{{ .StructName }}) IsEmpty() bool {
-	return t.Count() == 0
+	tableName := t.tableName
+	where, args := t.buildWhereClause()
+
+	query := fmt.Sprintf(` + "`SELECT 1 FROM \"%s\" WHERE %s LIMIT 1`" + `, tableName, where)
+
+	var found int
+	err := t.db.QueryRow(query, args...).Scan(&found)
+	if err != nil {
+		if err != sql.ErrNoRows {
+			fmt.Printf("Error: Failed to check {{ .Table.Name }} for records: %v\n", err)
+		}
+		return true
+	}
+
+	return false
 }
 
 // ModifyAll updates a field for all records matching current filters (BC/NAV style)
 // Returns the number of records modified
 func (t *{{ .StructName }}) ModifyAll(fieldName string, newValue interface{}) int {
-	tableName := fmt.Sprintf("%s$%s", t.company, {{ .StructName }}TableName)
+	tableName := t.tableName
 	where, args := t.buildWhereClause()
 
 	// Build UPDATE SQL
@@ -1781,7 +1805,7 @@ func (t *{{ .StructName }}) ModifyAll(fieldName string, newValue interface{}) in
 // DeleteAll deletes all records matching current filters (BC/NAV style)
 // Returns the number of records deleted
 func (t *{{ .StructName }}) DeleteAll() int {
-	tableName := fmt.Sprintf("%s$%s", t.company, {{ .StructName }}TableName)
+	tableName := t.tableName
 	where, args := t.buildWhereClause()
 
 	// Build DELETE SQL
@@ -1949,7 +1973,7 @@ func (t *{{ .StructName }}) ValidateField(fieldName string, value interface{}) e
 			t.{{ upperFirst .Name }} = {{ $.StructName }}{{ upperFirst .Name }}(v)
 		// Accept string (lookup in options and convert)
 		} else if v, ok := value.(string); ok {
-			options := []string{ {{- range $i, $opt := .Options }}{{- if $i }}, {{ end }}"{{ $opt }}"{{- end }} }
+			options := {{ lowerFirst $.StructName }}{{ upperFirst .Name }}Options
 			found := false
 			for i, opt := range options {
 				if opt == v {
@@ -2121,12 +2145,12 @@ func (t *{{ $.StructName }}) CustomValidate_{{ upperFirst .Name }}() error {
 	if t.{{ upperFirst .Name }} != "" && t.{{ upperFirst .Name }} != types.{{ if eq .Type "types.Code" }}Code{{ else }}Text{{ end }}("") {
 		var relatedRecord {{ .TableRelation.Table }}
 		relatedRecord.Init(t.db, t.company)
-		if !relatedRecord.Get(t.{{ upperFirst .Name }}) {
+		if !relatedRecord.Exists(t.{{ upperFirst .Name }}) {
 			return errors.New("{{ .Name }} does not exist in {{ .TableRelation.Table }} table")
 		}
 
 		// *** ADD YOUR CUSTOM LOGIC HERE ***
-		// You can access the related record:
+		// Exists only checks the key; use Get to access the related record:
 		// if !relatedRecord.Active {
 		//     return errors.New("{{ .TableRelation.Table }} is inactive")
 		// }